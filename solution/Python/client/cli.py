@@ -7,28 +7,37 @@ import httpx
 
 SERVER_URL = "http://localhost:3000"
 
+# Shared client so all requests reuse one connection pool (keep-alive)
+# instead of paying a TCP handshake per call. HTTP/2 lets concurrent
+# requests multiplex over a single connection when the server supports it.
+_CLIENT = httpx.AsyncClient(
+    base_url=SERVER_URL,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    timeout=30.0,
+    http2=True,
+)
+
 
 async def test_add_endpoint():
     """Test the /demo/add endpoint."""
     try:
         a = 5
         b = 7
-        
+
         print(f"Calling /demo/add with a={a}, b={b}")
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{SERVER_URL}/demo/add",
-                json={"a": a, "b": b}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            print(f"Result: {data['result']}")
+
+        response = await _CLIENT.post(
+            "/demo/add",
+            json={"a": a, "b": b}
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        print(f"Result: {data['result']}")
+    except httpx.HTTPStatusError as e:
+        print(f"HTTP {e.response.status_code}: {e.response.text}")
     except httpx.HTTPError as e:
-        print(f"Error calling API: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Response data: {e.response.text}")
+        print(f"Transport error: {e}")
     except Exception as e:
         print(f"Unexpected error: {e}")
 
@@ -38,156 +47,156 @@ async def test_configuration_endpoints():
     print("=== Machine Configuration Test Scenario ===\n")
     
     try:
-        async with httpx.AsyncClient() as client:
-            # 1. List all machines
-            print("1. Listing all available machines...")
-            response = await client.get(f"{SERVER_URL}/configure/machines")
-            response.raise_for_status()
-            print(f"Machines: {json.dumps(response.json(), indent=2)}")
-            print()
-            
-            # 2. Get settings for molder_1
-            print("2. Getting settings definition for molder_1...")
-            response = await client.get(f"{SERVER_URL}/configure/machines/molder_1/settings")
-            response.raise_for_status()
-            print("Settings for molder_1:")
-            print(json.dumps(response.json(), indent=2))
-            print()
-            
-            # 3. Apply INVALID settings
-            print("3. Applying INVALID settings to molder_1...")
-            print("   - Missing required field \"guardsClosedRequired\"")
-            print("   - Invalid value for \"screwSpeed\" (negative number)")
-            try:
-                response = await client.post(
-                    f"{SERVER_URL}/configure/machines/molder_1/settings",
-                    json={
-                        "settings": [
-                            {
-                                "identifier": "materialName",
-                                "value": "ABS"
-                            },
-                            {
-                                "identifier": "screwSpeed",
-                                "value": -50,
-                                "uom": "rpm"
-                            },
-                            {
-                                "identifier": "barrelTemperature",
-                                "value": 250,
-                                "uom": "°C"
-                            }
-                        ]
-                    }
-                )
-                response.raise_for_status()
-                print("   ✗ ERROR: Invalid settings were accepted (should have failed!)")
-            except httpx.HTTPStatusError as e:
-                print("   ✓ Validation failed as expected:")
-                print(f"   {json.dumps(e.response.json(), indent=2)}")
-            print()
-            
-            # 4. Apply VALID settings
-            print("4. Applying VALID settings to molder_1...")
-            valid_settings = {
-                "settings": [
-                    {
-                        "identifier": "materialName",
-                        "value": "ABS"
-                    },
-                    {
-                        "identifier": "guardsClosedRequired",
-                        "value": True
-                    },
-                    {
-                        "identifier": "barrelTemperature",
-                        "value": 250,
-                        "uom": "°C"
-                    },
-                    {
-                        "identifier": "moldTemperature",
-                        "value": 70,
-                        "uom": "°C"
-                    },
-                    {
-                        "identifier": "injectionPressure",
-                        "value": 1400,
-                        "uom": "bar"
-                    },
-                    {
-                        "identifier": "screwSpeed",
-                        "value": 100,
-                        "uom": "rpm"
-                    },
-                    {
-                        "identifier": "coolingTime",
-                        "value": 15,
-                        "uom": "s"
-                    }
-                ]
-            }
-            print(f"   Settings to apply: {json.dumps(valid_settings, indent=2)}")
-            response = await client.post(
-                f"{SERVER_URL}/configure/machines/molder_1/settings",
-                json=valid_settings
-            )
-            response.raise_for_status()
-            print(f"   ✓ Success: {response.json()['message']}")
-            print()
-            
-            # 5. Test with unit conversion
-            print("5. Applying settings with unit conversion (°F to °C)...")
-            settings_with_conversion = {
-                "settings": [
-                    {
-                        "identifier": "materialName",
-                        "value": "PP"
-                    },
-                    {
-                        "identifier": "guardsClosedRequired",
-                        "value": True
-                    },
-                    {
-                        "identifier": "barrelTemperature",
-                        "value": 482,
-                        "uom": "°F"
-                    },
-                    {
-                        "identifier": "moldTemperature",
-                        "value": 158,
-                        "uom": "°F"
-                    },
-                    {
-                        "identifier": "injectionPressure",
-                        "value": 20305,
-                        "uom": "psi"
-                    },
-                    {
-                        "identifier": "screwSpeed",
-                        "value": 1.67,
-                        "uom": "rps"
-                    },
-                    {
-                        "identifier": "coolingTime",
-                        "value": None
-                    }
-                ]
-            }
-            print(f"   Settings with unit conversion: {json.dumps(settings_with_conversion, indent=2)}")
-            response = await client.post(
-                f"{SERVER_URL}/configure/machines/molder_1/settings",
-                json=settings_with_conversion
+        # 1. + 2. List all machines and get settings for molder_1; the two
+        # reads are independent, so issue them concurrently on one connection
+        print("1. Listing all available machines...")
+        print("2. Getting settings definition for molder_1...")
+        machines_response, settings_response = await asyncio.gather(
+            _CLIENT.get("/configure/machines"),
+            _CLIENT.get("/configure/machines/molder_1/settings")
+        )
+        machines_response.raise_for_status()
+        settings_response.raise_for_status()
+        print(f"Machines: {json.dumps(machines_response.json(), indent=2)}")
+        print()
+        print("Settings for molder_1:")
+        print(json.dumps(settings_response.json(), indent=2))
+        print()
+        
+        # 3. Apply INVALID settings
+        print("3. Applying INVALID settings to molder_1...")
+        print("   - Missing required field \"guardsClosedRequired\"")
+        print("   - Invalid value for \"screwSpeed\" (negative number)")
+        try:
+            response = await _CLIENT.post(
+                "/configure/machines/molder_1/settings",
+                json={
+                    "settings": [
+                        {
+                            "identifier": "materialName",
+                            "value": "ABS"
+                        },
+                        {
+                            "identifier": "screwSpeed",
+                            "value": -50,
+                            "uom": "rpm"
+                        },
+                        {
+                            "identifier": "barrelTemperature",
+                            "value": 250,
+                            "uom": "°C"
+                        }
+                    ]
+                }
             )
             response.raise_for_status()
-            print(f"   ✓ Success: {response.json()['message']}")
-            print()
-            
-            print("=== All tests completed successfully! ===")
-            
+            print("   ✗ ERROR: Invalid settings were accepted (should have failed!)")
+        except httpx.HTTPStatusError as e:
+            print("   ✓ Validation failed as expected:")
+            print(f"   {json.dumps(e.response.json(), indent=2)}")
+        print()
+        
+        # 4. Apply VALID settings
+        print("4. Applying VALID settings to molder_1...")
+        valid_settings = {
+            "settings": [
+                {
+                    "identifier": "materialName",
+                    "value": "ABS"
+                },
+                {
+                    "identifier": "guardsClosedRequired",
+                    "value": True
+                },
+                {
+                    "identifier": "barrelTemperature",
+                    "value": 250,
+                    "uom": "°C"
+                },
+                {
+                    "identifier": "moldTemperature",
+                    "value": 70,
+                    "uom": "°C"
+                },
+                {
+                    "identifier": "injectionPressure",
+                    "value": 1400,
+                    "uom": "bar"
+                },
+                {
+                    "identifier": "screwSpeed",
+                    "value": 100,
+                    "uom": "rpm"
+                },
+                {
+                    "identifier": "coolingTime",
+                    "value": 15,
+                    "uom": "s"
+                }
+            ]
+        }
+        print(f"   Settings to apply: {json.dumps(valid_settings, indent=2)}")
+        response = await _CLIENT.post(
+            "/configure/machines/molder_1/settings",
+            json=valid_settings
+        )
+        response.raise_for_status()
+        print(f"   ✓ Success: {response.json()['message']}")
+        print()
+        
+        # 5. Test with unit conversion
+        print("5. Applying settings with unit conversion (°F to °C)...")
+        settings_with_conversion = {
+            "settings": [
+                {
+                    "identifier": "materialName",
+                    "value": "PP"
+                },
+                {
+                    "identifier": "guardsClosedRequired",
+                    "value": True
+                },
+                {
+                    "identifier": "barrelTemperature",
+                    "value": 482,
+                    "uom": "°F"
+                },
+                {
+                    "identifier": "moldTemperature",
+                    "value": 158,
+                    "uom": "°F"
+                },
+                {
+                    "identifier": "injectionPressure",
+                    "value": 20305,
+                    "uom": "psi"
+                },
+                {
+                    "identifier": "screwSpeed",
+                    "value": 1.67,
+                    "uom": "rps"
+                },
+                {
+                    "identifier": "coolingTime",
+                    "value": None
+                }
+            ]
+        }
+        print(f"   Settings with unit conversion: {json.dumps(settings_with_conversion, indent=2)}")
+        response = await _CLIENT.post(
+            "/configure/machines/molder_1/settings",
+            json=settings_with_conversion
+        )
+        response.raise_for_status()
+        print(f"   ✓ Success: {response.json()['message']}")
+        print()
+        
+        print("=== All tests completed successfully! ===")
+        
+    except httpx.HTTPStatusError as e:
+        print(f"✗ HTTP {e.response.status_code}: {e.response.text}")
     except httpx.HTTPError as e:
-        print(f"✗ Error calling API: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Response data: {e.response.text}")
+        print(f"✗ Transport error: {e}")
     except Exception as e:
         print(f"✗ Unexpected error: {e}")
 
@@ -195,10 +204,11 @@ async def test_configuration_endpoints():
 async def run_all_tests():
     """Run all tests."""
     print("=== Running Demo Tests ===\n")
-    await test_add_endpoint()
-    print("\n")
-    
-    await test_configuration_endpoints()
+    async with _CLIENT:
+        await test_add_endpoint()
+        print("\n")
+
+        await test_configuration_endpoints()
 
 
 def main():
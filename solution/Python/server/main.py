@@ -1,11 +1,14 @@
 """Main FastAPI server application."""
 import os
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 from .routers import demo, configure
 
-app = FastAPI(title="Configurizer API")
+# orjson serializes responses several times faster than the stdlib json
+# encoder used by the default JSONResponse
+app = FastAPI(title="Configurizer API", default_response_class=ORJSONResponse)
 
 # Register routers
 app.include_router(demo.router, prefix="/demo", tags=["demo"])
@@ -15,7 +18,18 @@ app.include_router(configure.router, prefix="/configure", tags=["configure"])
 def run():
     """Run the server."""
     port = int(os.environ.get("PORT", 3000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop and httptools roughly double uvicorn throughput over the
+    # default asyncio loop and h11 parser; access logging is disabled
+    # because per-request log writes dominate trivial endpoints
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        log_level="warning",
+    )
 
 
 if __name__ == "__main__":
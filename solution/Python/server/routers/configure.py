@@ -1,8 +1,10 @@
 """Configure router for machine configuration endpoints."""
-import json
 import os
+import sys
 from typing import Any, Optional
-from fastapi import APIRouter, HTTPException
+import msgspec
+import orjson
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
 from shared import (
@@ -15,6 +17,11 @@ from shared import (
 
 router = APIRouter()
 
+# Maps uom strings to enum members; a plain dict probe is cheaper than
+# UnitOfMeasure(...), which goes through the enum machinery and raises
+# on unknown values
+_UOM_BY_STR: dict[str, UnitOfMeasure] = {u.value: u for u in UnitOfMeasure}
+
 # List of configurable machine types
 CONFIGURABLE_MACHINES = {
     "InjectionMolder": InjectionMolder
@@ -25,8 +32,8 @@ config_path = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "../../../configurations/machines.json")
 )
 
-with open(config_path, 'r') as f:
-    machines_config = json.load(f)
+with open(config_path, 'rb') as f:
+    machines_config = orjson.loads(f.read())
 
 # Initialize machines
 machines: dict[str, ConfigurableMachine] = {}
@@ -45,6 +52,47 @@ for name, config in machines_config.items():
         raise ValueError(f"Unknown machine type: {machine_type_name}")
 
 
+def _build_settings_payload(machine: ConfigurableMachine) -> list[dict[str, Any]]:
+    """Convert a machine's settings definition to a JSON-serializable list.
+
+    Args:
+        machine: Machine whose settings to convert
+
+    Returns:
+        List of setting dicts
+    """
+    settings_dict = []
+    for setting in machine.settings:
+        setting_data = {
+            "namespace": setting.namespace,
+            "identifier": setting.identifier,
+            "description": setting.description,
+            "type": setting.type.value,
+            "nullable": setting.nullable,
+        }
+
+        # Add type-specific fields
+        if hasattr(setting, 'default_value') and setting.default_value is not None:
+            setting_data["defaultValue"] = setting.default_value
+        if hasattr(setting, 'uom') and setting.uom is not None:
+            setting_data["uom"] = setting.uom.value
+        if hasattr(setting, 'min_value') and setting.min_value is not None:
+            setting_data["minValue"] = setting.min_value
+        if hasattr(setting, 'max_value') and setting.max_value is not None:
+            setting_data["maxValue"] = setting.max_value
+
+        settings_dict.append(setting_data)
+
+    return settings_dict
+
+
+# Settings definitions are static, so serialize them once at startup
+# instead of rebuilding the payload on every request
+settings_payloads: dict[str, list[dict[str, Any]]] = {
+    name: _build_settings_payload(machine) for name, machine in machines.items()
+}
+
+
 class MachineInfo(BaseModel):
     """Information about a machine."""
     name: str
@@ -56,24 +104,39 @@ class MachinesResponse(BaseModel):
     machines: list[MachineInfo]
 
 
+# The machine list never changes after startup, so build the response once
+# and serve the same instance from list_machines
+machines_response = MachinesResponse(
+    machines=[
+        MachineInfo(name=name, type=machines_config[name]["type"])
+        for name in machines
+    ]
+)
+
+
 class SettingResponse(BaseModel):
     """Response containing setting definition."""
     machine: str
     settings: list[dict[str, Any]]
 
 
-class SettingValueRequest(BaseModel):
+class SettingValueRequest(msgspec.Struct):
     """A setting value in a request."""
     identifier: str
     value: Optional[Any] = None
     uom: Optional[str] = None
 
 
-class ApplySettingsRequest(BaseModel):
+class ApplySettingsRequest(msgspec.Struct):
     """Request to apply settings."""
     settings: list[SettingValueRequest]
 
 
+# Compiled once: decodes the request body straight into slotted structs,
+# skipping the per-field Pydantic model construction
+_apply_settings_decoder = msgspec.json.Decoder(ApplySettingsRequest)
+
+
 class ApplySettingsResponse(BaseModel):
     """Response from applying settings."""
     message: str
@@ -87,22 +150,17 @@ class ErrorResponse(BaseModel):
 
 
 @router.get("/machines", response_model=MachinesResponse)
-async def list_machines() -> MachinesResponse:
+def list_machines() -> MachinesResponse:
     """List all available machines.
-    
+
     Returns:
         List of available machines
     """
-    machine_list = []
-    for name in machines.keys():
-        config = machines_config[name]
-        machine_list.append(MachineInfo(name=name, type=config["type"]))
-    
-    return MachinesResponse(machines=machine_list)
+    return machines_response
 
 
 @router.get("/machines/{name}/settings", response_model=SettingResponse)
-async def get_machine_settings(name: str) -> SettingResponse:
+def get_machine_settings(name: str) -> SettingResponse:
     """Get settings definition for a specific machine.
     
     Args:
@@ -114,80 +172,66 @@ async def get_machine_settings(name: str) -> SettingResponse:
     Raises:
         HTTPException: If machine not found
     """
-    machine = machines.get(name)
-    
-    if not machine:
+    settings_dict = settings_payloads.get(name)
+
+    if settings_dict is None:
         raise HTTPException(status_code=404, detail=f"Machine '{name}' not found")
-    
-    # Convert settings to dict
-    settings_dict = []
-    for setting in machine.settings:
-        setting_data = {
-            "namespace": setting.namespace,
-            "identifier": setting.identifier,
-            "description": setting.description,
-            "type": setting.type.value,
-            "nullable": setting.nullable,
-        }
-        
-        # Add type-specific fields
-        if hasattr(setting, 'default_value') and setting.default_value is not None:
-            setting_data["defaultValue"] = setting.default_value
-        if hasattr(setting, 'uom') and setting.uom is not None:
-            setting_data["uom"] = setting.uom.value
-        if hasattr(setting, 'min_value') and setting.min_value is not None:
-            setting_data["minValue"] = setting.min_value
-        if hasattr(setting, 'max_value') and setting.max_value is not None:
-            setting_data["maxValue"] = setting.max_value
-        
-        settings_dict.append(setting_data)
-    
+
     return SettingResponse(machine=name, settings=settings_dict)
 
 
 @router.post("/machines/{name}/settings", response_model=ApplySettingsResponse)
 async def apply_machine_settings(
-    name: str, 
-    request: ApplySettingsRequest
+    name: str,
+    request: Request
 ) -> ApplySettingsResponse:
     """Apply settings to a specific machine.
-    
+
     Args:
         name: Machine name
-        request: Settings to apply
-        
+        request: Raw request whose body contains the settings to apply
+
     Returns:
         Success message
-        
+
     Raises:
         HTTPException: If machine not found or settings invalid
     """
     machine = machines.get(name)
-    
+
     if not machine:
         raise HTTPException(status_code=404, detail=f"Machine '{name}' not found")
-    
+
+    try:
+        body = _apply_settings_decoder.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid request body: {e}")
+
     # Convert request to SettingValue objects
     settings = []
-    for setting_req in request.settings:
+    for setting_req in body.settings:
         uom = None
-        if setting_req.uom:
-            try:
-                uom = UnitOfMeasure(setting_req.uom)
-            except ValueError:
+        uom_raw = setting_req.uom
+        if uom_raw:
+            uom = _UOM_BY_STR.get(uom_raw)
+            if uom is None:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Invalid unit of measure: {setting_req.uom}"
+                    detail=f"Invalid unit of measure: {uom_raw}"
                 )
-        
+
+        # Intern the identifier: the strings coming out of the JSON decoder
+        # are fresh objects, interning lets the validation dict probes
+        # compare by pointer identity
         settings.append(SettingValue(
-            identifier=setting_req.identifier,
+            identifier=sys.intern(setting_req.identifier),
             value=setting_req.value,
             uom=uom
         ))
     
-    # Apply settings
-    errors = machine.apply_settings(settings)
+    # Apply settings in a worker thread so the file write cannot block
+    # the event loop
+    errors = await machine.apply_settings_async(settings)
     
     if errors:
         error_dicts = [{"identifier": e.identifier, "message": e.message} for e in errors]
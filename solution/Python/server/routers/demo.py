@@ -1,32 +1,50 @@
 """Demo router for simple endpoints."""
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-
-from shared import add
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 
 router = APIRouter()
 
 
-class AddRequest(BaseModel):
+class AddRequest(msgspec.Struct):
     """Request model for add endpoint."""
     a: float
     b: float
 
 
-class AddResponse(BaseModel):
-    """Response model for add endpoint."""
-    result: float
+# Compiled once: decodes the request body straight into a slotted struct
+_add_request_decoder = msgspec.json.Decoder(AddRequest)
+
+
+async def _decode_add_request(request: Request) -> AddRequest:
+    """Decode the add request body with msgspec.
 
+    Args:
+        request: Raw request whose body contains the numbers to add
+
+    Returns:
+        Decoded request
 
-@router.post("/add", response_model=AddResponse)
-async def add_numbers(request: AddRequest) -> AddResponse:
+    Raises:
+        HTTPException: If the body is not a valid add request
+    """
+    try:
+        return _add_request_decoder.decode(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid request body: {e}")
+
+
+@router.post("/add")
+def add_numbers(request: AddRequest = Depends(_decode_add_request)) -> ORJSONResponse:
     """Add two numbers together.
-    
+
     Args:
         request: Request containing two numbers to add
-        
+
     Returns:
         Result of addition
     """
-    result = add(request.a, request.b)
-    return AddResponse(result=result)
+    # The addition is done inline and the response built directly: for an
+    # endpoint this trivial, the shared.add call frame and the
+    # response-model validation would cost more than the work itself
+    return ORJSONResponse({"result": request.a + request.b})
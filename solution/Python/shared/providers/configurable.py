@@ -1,7 +1,11 @@
 """Base classes for configurable machines."""
+import asyncio
+import math
+import sys
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Any, Optional, Union
+from functools import cached_property
+from typing import Any, Callable, Optional, Sequence, Union
 from dataclasses import dataclass
 
 
@@ -24,7 +28,7 @@ class UnitOfMeasure(str, Enum):
     MINUTE = "min"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SettingBase:
     """Base class for all settings."""
     namespace: Optional[str]
@@ -33,7 +37,7 @@ class SettingBase:
     nullable: Optional[bool] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NumericSetting(SettingBase):
     """Numeric setting with optional unit of measure and range."""
     type: SettingType = SettingType.NUMBER
@@ -43,14 +47,14 @@ class NumericSetting(SettingBase):
     max_value: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class StringSetting(SettingBase):
     """String setting."""
     type: SettingType = SettingType.STRING
     default_value: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BooleanSetting(SettingBase):
     """Boolean setting."""
     type: SettingType = SettingType.BOOLEAN
@@ -60,7 +64,26 @@ class BooleanSetting(SettingBase):
 Setting = Union[NumericSetting, StringSetting, BooleanSetting]
 
 
-@dataclass
+# Every supported conversion is linear, so the table stores (scale, offset)
+# coefficients keyed by (from, to): converting is one dict probe plus one
+# multiply-add instead of a call into a conversion function
+_UOM_CONV: dict[tuple[UnitOfMeasure, UnitOfMeasure], tuple[float, float]] = {
+    # Temperature conversions
+    (UnitOfMeasure.DEGREE_CELSIUS, UnitOfMeasure.DEGREE_FAHRENHEIT): (9 / 5, 32.0),
+    (UnitOfMeasure.DEGREE_FAHRENHEIT, UnitOfMeasure.DEGREE_CELSIUS): (5 / 9, -32 * 5 / 9),
+    # Pressure conversions
+    (UnitOfMeasure.BAR, UnitOfMeasure.PSI): (14.5037738007218, 0.0),
+    (UnitOfMeasure.PSI, UnitOfMeasure.BAR): (1 / 14.5037738007218, 0.0),
+    # Speed conversions
+    (UnitOfMeasure.RPM, UnitOfMeasure.RPS): (1 / 60, 0.0),
+    (UnitOfMeasure.RPS, UnitOfMeasure.RPM): (60.0, 0.0),
+    # Time conversions
+    (UnitOfMeasure.SECOND, UnitOfMeasure.MINUTE): (1 / 60, 0.0),
+    (UnitOfMeasure.MINUTE, UnitOfMeasure.SECOND): (60.0, 0.0),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class SettingValue:
     """A setting value to be applied."""
     identifier: str
@@ -68,13 +91,115 @@ class SettingValue:
     uom: Optional[UnitOfMeasure] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SettingError:
     """An error in a setting value."""
     identifier: str
     message: str
 
 
+# Shared result for the common no-errors case, so successful verification
+# and application never allocate a fresh empty list
+_EMPTY_ERRORS: tuple[SettingError, ...] = ()
+
+
+def _validate_string(
+    machine: "ConfigurableMachine",
+    definition: Setting,
+    provided: Optional[SettingValue],
+    value: Any
+) -> Optional[SettingError]:
+    """Validate a string setting value."""
+    if not isinstance(value, str):
+        return SettingError(
+            identifier=definition.identifier,
+            message="Value must be a string"
+        )
+    return None
+
+
+def _validate_boolean(
+    machine: "ConfigurableMachine",
+    definition: Setting,
+    provided: Optional[SettingValue],
+    value: Any
+) -> Optional[SettingError]:
+    """Validate a boolean setting value."""
+    if not isinstance(value, bool):
+        return SettingError(
+            identifier=definition.identifier,
+            message="Value must be a boolean"
+        )
+    return None
+
+
+def _validate_number(
+    machine: "ConfigurableMachine",
+    definition: Setting,
+    provided: Optional[SettingValue],
+    value: Any
+) -> Optional[SettingError]:
+    """Validate a numeric setting value, including uom and range checks."""
+    identifier = definition.identifier
+
+    # bool is a subclass of int, so it must be rejected explicitly
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return SettingError(
+            identifier=identifier,
+            message="Value must be a number"
+        )
+
+    setting_uom = definition.uom
+    provided_uom = provided.uom if provided is not None else None
+
+    if provided_uom is not None and setting_uom is None:
+        return SettingError(
+            identifier=identifier,
+            message="Unit of measure is not supported for this setting"
+        )
+
+    # Convert value if needed
+    value_for_range = value
+    if (setting_uom is not None and
+        provided_uom is not None and
+        provided_uom != setting_uom):
+        converted = machine._convert_uom(value, provided_uom, setting_uom)
+        if converted is None:
+            return SettingError(
+                identifier=identifier,
+                message="Unit of measure is not convertible to required unit"
+            )
+        value_for_range = converted
+
+    # Check range; the precomputed ±inf bounds make the in-range case a
+    # single chained comparison without None checks
+    lo, hi = machine._range_map[identifier]
+    if not (lo <= value_for_range <= hi):
+        if value_for_range < lo:
+            return SettingError(
+                identifier=identifier,
+                message=f"Value must be >= {definition.min_value}"
+            )
+        return SettingError(
+            identifier=identifier,
+            message=f"Value must be <= {definition.max_value}"
+        )
+
+    return None
+
+
+# Dispatches a setting's type to its validator in one dict probe instead of
+# an if/elif chain over SettingType
+_VALIDATORS: dict[
+    SettingType,
+    Callable[["ConfigurableMachine", Setting, Optional[SettingValue], Any], Optional[SettingError]]
+] = {
+    SettingType.STRING: _validate_string,
+    SettingType.BOOLEAN: _validate_boolean,
+    SettingType.NUMBER: _validate_number,
+}
+
+
 class ConfigurableMachine(ABC):
     """Abstract base class for configurable machines."""
     
@@ -83,8 +208,58 @@ class ConfigurableMachine(ABC):
     def settings(self) -> list[Setting]:
         """Get the list of settings for this machine."""
         pass
-    
-    def _verify_settings(self, settings: list[SettingValue]) -> list[SettingError]:
+
+    @cached_property
+    def _definition_map(self) -> dict[str, Setting]:
+        """Identifier-to-definition lookup, built once per machine.
+
+        Keys are interned so probes with likewise-interned identifiers
+        compare by pointer identity.
+        """
+        return {sys.intern(definition.identifier): definition for definition in self.settings}
+
+    @cached_property
+    def _range_map(self) -> dict[str, tuple[float, float]]:
+        """Numeric range bounds per identifier, with ±inf for missing limits."""
+        return {
+            definition.identifier: (
+                definition.min_value if definition.min_value is not None else -math.inf,
+                definition.max_value if definition.max_value is not None else math.inf,
+            )
+            for definition in self.settings
+            if isinstance(definition, NumericSetting)
+        }
+
+    @cached_property
+    def _required_no_default(self) -> frozenset[str]:
+        """Identifiers that must be provided: not nullable and no default."""
+        return frozenset(
+            identifier
+            for identifier, definition in self._definition_map.items()
+            if definition.nullable is not True
+            and getattr(definition, 'default_value', None) is None
+        )
+
+    @cached_property
+    def _validation_plan(self) -> list[tuple[str, Callable, Any, bool, Setting]]:
+        """Per-setting metadata precomputed for _verify_settings.
+
+        Each entry packs (identifier, validator, default_value, is_numeric,
+        definition) so the validation loop binds plain locals by unpacking
+        instead of doing attribute lookups per iteration.
+        """
+        return [
+            (
+                identifier,
+                _VALIDATORS[definition.type],
+                getattr(definition, 'default_value', None),
+                definition.type == SettingType.NUMBER,
+                definition,
+            )
+            for identifier, definition in self._definition_map.items()
+        ]
+
+    def _verify_settings(self, settings: list[SettingValue]) -> Sequence[SettingError]:
         """Verify that settings are valid.
         
         Performs the following checks:
@@ -101,137 +276,100 @@ class ConfigurableMachine(ABC):
         Returns:
             List of errors (empty if valid)
         """
-        errors: list[SettingError] = []
-        
-        # Build definition map
-        definition_map: dict[str, Setting] = {}
-        for definition in self.settings:
-            definition_map[definition.identifier] = definition
-        
-        # Check for duplicates
-        seen_provided: set[str] = set()
-        duplicate_provided: set[str] = set()
-        for provided in settings:
-            if provided.identifier in seen_provided:
-                duplicate_provided.add(provided.identifier)
-            else:
-                seen_provided.add(provided.identifier)
-        
-        for identifier in duplicate_provided:
-            errors.append(SettingError(
-                identifier=identifier,
-                message="Duplicate setting identifier provided"
-            ))
-        
-        # Build provided map (keep first occurrence)
+        # Allocated lazily: the expected case is a valid payload, which
+        # returns the shared empty tuple without building a list
+        errors: Optional[list[SettingError]] = None
+
+        definition_map = self._definition_map
+
+        # Identifiers that already produced an error; once flagged, a setting
+        # is excluded from further checks so it gets at most one error
+        errored_identifiers: set[str] = set()
+
+        # Build provided map (keep first occurrence), flagging duplicates and
+        # unknown identifiers in the same pass
         provided_map: dict[str, SettingValue] = {}
         for provided in settings:
+            if provided.identifier in provided_map:
+                if errors is None:
+                    errors = []
+                errors.append(SettingError(
+                    identifier=provided.identifier,
+                    message="Duplicate setting identifier provided"
+                ))
+                errored_identifiers.add(provided.identifier)
+                continue
+
             if provided.identifier not in definition_map:
+                if errors is None:
+                    errors = []
                 errors.append(SettingError(
                     identifier=provided.identifier,
                     message="Unknown setting identifier"
                 ))
+                errored_identifiers.add(provided.identifier)
+                continue
+
+            provided_map[provided.identifier] = provided
+
+        # Missing-value check against the precomputed set of identifiers
+        # that have neither a default nor the nullable flag
+        for identifier in self._required_no_default:
+            if identifier in errored_identifiers:
                 continue
-            
-            if provided.identifier not in provided_map:
-                provided_map[provided.identifier] = provided
-        
-        # Verify each definition
-        for identifier, definition in definition_map.items():
             provided = provided_map.get(identifier)
-            nullable = definition.nullable is True
-            
-            has_provided_value = provided is not None and provided.value is not None
-            default_value = getattr(definition, 'default_value', None)
-            has_default_value = default_value is not None
-            
-            if not nullable and not has_provided_value and not has_default_value:
+            if provided is None or provided.value is None:
+                if errors is None:
+                    errors = []
                 errors.append(SettingError(
                     identifier=identifier,
                     message="Missing value (no default and not nullable)"
                 ))
+                errored_identifiers.add(identifier)
+
+        # Verify each definition using the precomputed plan
+        for identifier, validator, default_value, is_numeric, definition in self._validation_plan:
+            if identifier in errored_identifiers:
                 continue
-            
+
+            provided = provided_map.get(identifier)
+
+            has_provided_value = provided is not None and provided.value is not None
+
             # Determine effective value
             effective_value = provided.value if has_provided_value else default_value
             if effective_value is None:
                 # Nullable without value is fine
-                if definition.type != SettingType.NUMBER and provided is not None and provided.uom is not None:
+                if not is_numeric and provided is not None and provided.uom is not None:
+                    if errors is None:
+                        errors = []
                     errors.append(SettingError(
                         identifier=identifier,
                         message="Unit of measure is only allowed for numeric settings"
                     ))
                 continue
-            
+
             # Check if UOM is used on non-numeric settings
-            if definition.type != SettingType.NUMBER and provided is not None and provided.uom is not None:
+            if not is_numeric and provided is not None and provided.uom is not None:
+                if errors is None:
+                    errors = []
                 errors.append(SettingError(
                     identifier=identifier,
                     message="Unit of measure is only allowed for numeric settings"
                 ))
-            
-            # Type-specific validation
-            if definition.type == SettingType.STRING:
-                if not isinstance(effective_value, str):
-                    errors.append(SettingError(
-                        identifier=identifier,
-                        message="Value must be a string"
-                    ))
-            elif definition.type == SettingType.BOOLEAN:
-                if not isinstance(effective_value, bool):
-                    errors.append(SettingError(
-                        identifier=identifier,
-                        message="Value must be a boolean"
-                    ))
-            elif definition.type == SettingType.NUMBER:
-                if not isinstance(effective_value, (int, float)):
-                    errors.append(SettingError(
-                        identifier=identifier,
-                        message="Value must be a number"
-                    ))
-                    continue
-                
-                assert isinstance(definition, NumericSetting)
-                setting_uom = definition.uom
-                provided_uom = provided.uom if provided is not None else None
-                
-                if provided_uom is not None and setting_uom is None:
-                    errors.append(SettingError(
-                        identifier=identifier,
-                        message="Unit of measure is not supported for this setting"
-                    ))
-                    continue
-                
-                # Convert value if needed
-                value_for_range = effective_value
-                if (setting_uom is not None and 
-                    provided_uom is not None and 
-                    provided_uom != setting_uom):
-                    converted = self._convert_uom(effective_value, provided_uom, setting_uom)
-                    if converted is None:
-                        errors.append(SettingError(
-                            identifier=identifier,
-                            message="Unit of measure is not convertible to required unit"
-                        ))
-                        continue
-                    value_for_range = converted
-                
-                # Check range
-                if definition.min_value is not None and value_for_range < definition.min_value:
-                    errors.append(SettingError(
-                        identifier=identifier,
-                        message=f"Value must be >= {definition.min_value}"
-                    ))
-                if definition.max_value is not None and value_for_range > definition.max_value:
-                    errors.append(SettingError(
-                        identifier=identifier,
-                        message=f"Value must be <= {definition.max_value}"
-                    ))
-        
-        return errors
+                continue
+
+            # Type-specific validation via the precomputed validator
+            error = validator(self, definition, provided, effective_value)
+            if error is not None:
+                if errors is None:
+                    errors = []
+                errors.append(error)
+
+        return errors if errors is not None else _EMPTY_ERRORS
     
     @abstractmethod
-    def apply_settings(self, settings: list[SettingValue]) -> list[SettingError]:
+    def apply_settings(self, settings: list[SettingValue]) -> Sequence[SettingError]:
         """Apply settings to the machine.
         
         Args:
@@ -241,7 +379,21 @@ class ConfigurableMachine(ABC):
             List of errors (empty if successful)
         """
         pass
-    
+
+    async def apply_settings_async(self, settings: list[SettingValue]) -> Sequence[SettingError]:
+        """Apply settings without blocking the event loop.
+
+        Runs the synchronous apply_settings, which may perform file I/O,
+        in a worker thread.
+
+        Args:
+            settings: List of settings to apply
+
+        Returns:
+            List of errors (empty if successful)
+        """
+        return await asyncio.to_thread(self.apply_settings, settings)
+
     def _convert_uom(
         self, 
         value: float, 
@@ -258,31 +410,11 @@ class ConfigurableMachine(ABC):
         Returns:
             Converted value or None if conversion is not supported
         """
-        if from_uom == to_uom:
+        if from_uom is to_uom:
             return value
-        
-        # Temperature conversions
-        if from_uom == UnitOfMeasure.DEGREE_CELSIUS and to_uom == UnitOfMeasure.DEGREE_FAHRENHEIT:
-            return (value * 9 / 5) + 32
-        if from_uom == UnitOfMeasure.DEGREE_FAHRENHEIT and to_uom == UnitOfMeasure.DEGREE_CELSIUS:
-            return (value - 32) * 5 / 9
-        
-        # Pressure conversions
-        if from_uom == UnitOfMeasure.BAR and to_uom == UnitOfMeasure.PSI:
-            return value * 14.5037738007218
-        if from_uom == UnitOfMeasure.PSI and to_uom == UnitOfMeasure.BAR:
-            return value / 14.5037738007218
-        
-        # Speed conversions
-        if from_uom == UnitOfMeasure.RPM and to_uom == UnitOfMeasure.RPS:
-            return value / 60
-        if from_uom == UnitOfMeasure.RPS and to_uom == UnitOfMeasure.RPM:
-            return value * 60
-        
-        # Time conversions
-        if from_uom == UnitOfMeasure.SECOND and to_uom == UnitOfMeasure.MINUTE:
-            return value / 60
-        if from_uom == UnitOfMeasure.MINUTE and to_uom == UnitOfMeasure.SECOND:
-            return value * 60
-        
-        return None
+
+        entry = _UOM_CONV.get((from_uom, to_uom))
+        if entry is None:
+            return None
+        scale, offset = entry
+        return value * scale + offset
@@ -1,9 +1,13 @@
 """Injection molder machine configuration."""
-import json
+import hashlib
+import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence
+
+import orjson
 
 from .configurable import (
+    _EMPTY_ERRORS,
     ConfigurableMachine,
     Setting,
     SettingType,
@@ -16,7 +20,7 @@ from .configurable import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class InjectionMolderConfig:
     """Configuration for an injection molder machine."""
     file_path: str
@@ -29,15 +33,25 @@ class InjectionMolder(ConfigurableMachine):
     
     def __init__(self, config: InjectionMolderConfig):
         """Initialize injection molder with configuration.
-        
+
         Args:
             config: Machine configuration
         """
         self.config = config
-    
+        # The settings definition is static, so build it once per instance
+        # instead of allocating fresh Setting objects on every request
+        self._settings = self._build_settings()
+        # Hash of the last payload written to disk; used to skip writes
+        # when a POST repeats the current settings
+        self._last_payload_hash: Optional[bytes] = None
+
     @property
     def settings(self) -> list[Setting]:
         """Get the list of settings for this machine."""
+        return self._settings
+
+    def _build_settings(self) -> list[Setting]:
+        """Build the settings definition for this machine."""
         return [
             StringSetting(
                 namespace="material",
@@ -94,7 +108,7 @@ class InjectionMolder(ConfigurableMachine):
             )
         ]
     
-    def apply_settings(self, settings: list[SettingValue]) -> list[SettingError]:
+    def apply_settings(self, settings: list[SettingValue]) -> Sequence[SettingError]:
         """Apply settings to the machine.
         
         Args:
@@ -117,8 +131,18 @@ class InjectionMolder(ConfigurableMachine):
                 setting_dict["uom"] = setting.uom.value
             settings_dict.append(setting_dict)
         
-        # Save settings to file
-        with open(self.config.file_path, 'w') as f:
-            json.dump(settings_dict, f, indent=2)
-        
-        return []
+        # Save settings to file, unless the serialized payload matches what
+        # was last written
+        blob = orjson.dumps(settings_dict, option=orjson.OPT_INDENT_2)
+        payload_hash = hashlib.sha256(blob).digest()
+        if payload_hash == self._last_payload_hash:
+            return _EMPTY_ERRORS
+
+        # Write to a temp file and rename so readers never see a partial file
+        temp_path = self.config.file_path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(blob)
+        os.replace(temp_path, self.config.file_path)
+        self._last_payload_hash = payload_hash
+
+        return _EMPTY_ERRORS
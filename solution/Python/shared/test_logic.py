@@ -27,5 +27,5 @@ def test_add_with_zero():
 
 def test_add_decimal_numbers():
     """Test adding decimal numbers."""
-    assert add(1.5, 2.5) == 4
-    assert abs(add(0.1, 0.2) - 0.3) < 1e-9
+    assert add(1.5, 2.5) == pytest.approx(4.0)
+    assert add(0.1, 0.2) == pytest.approx(0.3, abs=1e-9)
@@ -1,6 +1,7 @@
 """Command-line client for testing the Configurizer API."""
 import asyncio
 import json
+import sys
 from typing import Any, Optional
 import httpx
 
@@ -8,40 +9,90 @@ import httpx
 SERVER_URL = "http://localhost:3000"
 
 
-async def test_add_endpoint():
-    """Test the /demo/add endpoint."""
+async def test_add_endpoint(client: httpx.AsyncClient):
+    """Test the /demo/add endpoint.
+
+    Args:
+        client: Shared HTTP client to issue requests with
+    """
     try:
         a = 5
         b = 7
-        
+
         print(f"Calling /demo/add with a={a}, b={b}")
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{SERVER_URL}/demo/add",
-                json={"a": a, "b": b}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            print(f"Result: {data['result']}")
+
+        response = await client.post(
+            "/demo/add",
+            json={"a": a, "b": b}
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        print(f"Result: {data['result']}")
+    except httpx.HTTPStatusError as e:
+        print(f"HTTP {e.response.status_code}: {e.response.text}")
     except httpx.HTTPError as e:
-        print(f"Error calling API: {e}")
-        if hasattr(e, 'response') and e.response is not None:
-            print(f"Response data: {e.response.text}")
+        print(f"Transport error: {e}")
     except Exception as e:
         print(f"Unexpected error: {e}")
 
+def test_add_endpoint_sync(client: httpx.Client):
+    """Test the /demo/add endpoint with the synchronous client.
+
+    Args:
+        client: Shared HTTP client to issue requests with
+    """
+    try:
+        a = 5
+        b = 7
+
+        print(f"Calling /demo/add with a={a}, b={b}")
+
+        response = client.post(
+            "/demo/add",
+            json={"a": a, "b": b}
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        print(f"Result: {data['result']}")
+    except httpx.HTTPStatusError as e:
+        print(f"HTTP {e.response.status_code}: {e.response.text}")
+    except httpx.HTTPError as e:
+        print(f"Transport error: {e}")
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+
+
 async def run_all_tests():
     """Run all tests."""
     print("=== Running Demo Tests ===\n")
-    await test_add_endpoint()
+    # One client for the whole run: every test reuses its connection pool
+    # instead of paying connection setup and teardown per call
+    async with httpx.AsyncClient(base_url=SERVER_URL, http2=True, timeout=5.0) as client:
+        await test_add_endpoint(client)
     print("\n")
-    
+
+
+def run_all_tests_sync():
+    """Run all tests with the synchronous client."""
+    print("=== Running Demo Tests ===\n")
+    with httpx.Client(base_url=SERVER_URL, timeout=5.0) as client:
+        test_add_endpoint_sync(client)
+    print("\n")
+
 
 def main():
-    """Main entry point for the client."""
-    asyncio.run(run_all_tests())
+    """Main entry point for the client.
+
+    The tests run strictly one after another, so the default path uses
+    the synchronous client and skips the event-loop startup entirely;
+    pass --async to exercise the asyncio code path instead.
+    """
+    if "--async" in sys.argv[1:]:
+        asyncio.run(run_all_tests())
+    else:
+        run_all_tests_sync()
 
 
 if __name__ == "__main__":
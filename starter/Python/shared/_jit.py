@@ -0,0 +1,18 @@
+"""Optional Numba JIT support for shared logic functions."""
+
+
+def maybe_njit(**kwargs):
+    """Build a decorator that JIT-compiles with Numba when it is installed.
+
+    Args:
+        kwargs: Options forwarded to numba.njit
+
+    Returns:
+        numba.njit configured with a persistent compile cache, or a no-op
+        decorator when Numba is not available
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return lambda f: f
+    return njit(cache=True, **kwargs)
@@ -1,6 +1,8 @@
 """Shared logic functions."""
+from ._jit import maybe_njit
 
 
+@maybe_njit()
 def add(a: float, b: float) -> float:
     """Add two numbers together.
     